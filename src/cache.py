@@ -0,0 +1,66 @@
+"""
+Result Cache Module.
+
+Caches computed EDA results on disk, keyed by a fingerprint of the input file,
+so repeated runs over an unchanged dataset skip parsing and analysis.
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+CACHE_DIR = Path("~/.cache/eda_tool").expanduser()
+
+# Leading bytes of the file mixed into the key alongside its size and mtime
+HEAD_BYTES = 65536
+
+# Mixed into every key; bump when the analysis or the shape of its results changes
+# so entries written by older versions are not reused
+CACHE_VERSION = 1
+
+
+def cache_key(path: str, variant: str = "") -> str:
+    """
+    Fingerprint a file from its first bytes, size and modification time.
+
+    variant distinguishes results computed differently from the same file.
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        head = f.read(HEAD_BYTES)
+    payload = head + f"{stat.st_size}:{stat.st_mtime_ns}:{CACHE_VERSION}:{variant}".encode()
+    if xxhash is not None:
+        return xxhash.xxh64(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def load(key: str, cache_dir: Path = CACHE_DIR) -> Optional[Any]:
+    """Return the cached result for key, or None on a miss or unreadable entry."""
+    try:
+        with open(cache_dir / f"{key}.pkl", 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def save(key: str, result: Any, cache_dir: Path = CACHE_DIR) -> bool:
+    """
+    Store result under key, replacing any existing entry atomically.
+
+    Returns False if the cache directory is not writable; caching is best effort.
+    """
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_dir / f"{key}.pkl.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_dir / f"{key}.pkl")
+    except OSError:
+        return False
+    return True
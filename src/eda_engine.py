@@ -1,53 +1,251 @@
+"""
+EDA Engine Module.
+
+Loads datasets and computes the statistical summaries behind the EDA reports.
+"""
+import os
+import warnings
+from functools import cached_property
+from typing import Optional, Tuple, Union
+
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pv
+except ImportError:
+    pa = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Files above this size are parsed in chunks when falling back to the C engine
+CHUNK_THRESHOLD_BYTES = 100 * 1024 * 1024
+CHUNK_SIZE = 100_000
+
+# String columns with fewer unique values than this share of rows become 'category'
+CATEGORY_RATIO = 0.5
+
+
+if njit is not None:
+    # fastmath is left off: it assumes no NaNs, which would break the comparisons
+    @njit(parallel=True, cache=True)
+    def _iqr_count(arr, low, high):
+        """Counts values outside [low, high] per column without a mask matrix."""
+        n, k = arr.shape
+        out = np.zeros(k, np.int64)
+        for j in prange(k):
+            c = 0
+            for i in range(n):
+                v = arr[i, j]
+                if v < low[j] or v > high[j]:
+                    c += 1
+            out[j] = c
+        return out
+else:
+    def _iqr_count(arr, low, high):
+        """Counts values outside [low, high] per column."""
+        return ((arr < low) | (arr > high)).sum(axis=0)
+
+
+def _read_csv(data_path: str, engine: str = "c") -> pd.DataFrame:
+    """Reads a CSV, with Arrow-backed dtypes when the PyArrow parser is used."""
+    if engine == "pyarrow":
+        # pandas' pyarrow engine does not support chunksize
+        df = pd.read_csv(data_path, engine="pyarrow", dtype_backend="pyarrow")
+        # Arrow infers ISO dates, times and timestamps, which the C engine leaves as text;
+        # re-read those columns verbatim so they are still summarised as categorical columns
+        temporal = [col for col, dtype in df.dtypes.items()
+                    if isinstance(dtype, pd.ArrowDtype) and pa.types.is_temporal(dtype.pyarrow_dtype)]
+        if temporal:
+            options = pv.ConvertOptions(include_columns=temporal, strings_can_be_null=True,
+                                        column_types={col: pa.string() for col in temporal})
+            text = pv.read_csv(data_path, convert_options=options).to_pandas(types_mapper=pd.ArrowDtype)
+            df[temporal] = text[temporal]
+        return df
+
+    kwargs = {"engine": engine, "cache_dates": True}
+    if engine == "c":
+        kwargs["low_memory"] = False
+    if os.path.getsize(data_path) > CHUNK_THRESHOLD_BYTES:
+        chunks = pd.read_csv(data_path, chunksize=CHUNK_SIZE, **kwargs)
+        return pd.concat(chunks, ignore_index=True)
+    return pd.read_csv(data_path, **kwargs)
+
+
+def _null_to_float(df: pd.DataFrame) -> pd.DataFrame:
+    """Casts Arrow null-typed columns to float, as the C engine reads all-empty columns."""
+    null_cols = [col for col, dtype in df.dtypes.items()
+                 if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype)]
+    if not null_cols:
+        return df
+    return df.astype({col: pd.ArrowDtype(pa.float64()) for col in null_cols})
+
+
+def _to_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts low-cardinality string columns to the 'category' dtype."""
+    if df.empty:
+        return df
+    str_cols = df.select_dtypes(include=['object', 'string']).columns
+    # Columns with no values at all are left as they are
+    cat_cols = [col for col in str_cols if 0 < df[col].nunique() / len(df) < CATEGORY_RATIO]
+    if not cat_cols:
+        return df
+    return df.astype({col: 'category' for col in cat_cols})
+
+
+def top_value_counts(series: pd.Series, k: int) -> Tuple[pd.Series, int]:
+    """Returns the k most frequent values with their counts, and the number of distinct values."""
+    # Counting integer category codes avoids hashing the values themselves
+    cat = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    codes = cat.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+    counts = np.bincount(codes, minlength=len(cat.cat.categories))
+
+    # Observed codes in order of first appearance, so ties rank as value_counts
+    # (and the streaming engine) rank them
+    seen = pd.unique(codes)
+    if k < len(seen):
+        # Keep everything tied with the k-th largest count so the cut is not arbitrary
+        kth = np.partition(counts[seen], len(seen) - k)[len(seen) - k]
+        seen = seen[counts[seen] >= kth]
+    top = seen[np.argsort(-counts[seen], kind='stable')[:k]]
+    return pd.Series(counts[top], index=cat.cat.categories[top]), int(np.count_nonzero(counts))
+
+
 class EDAEngine:
-    def __init__(self, data_path: str):
-        self.df = pd.read_csv(data_path)
+    def __init__(self, data: Union[str, pd.DataFrame], engine: Optional[str] = None):
+        if engine is None:
+            engine = "pyarrow" if pa is not None else "c"
+
+        df = data if isinstance(data, pd.DataFrame) else _read_csv(data, engine)
+        self.df = _to_categorical(_null_to_float(df))
+
+    @cached_property
+    def _nums(self) -> pd.DataFrame:
+        """Numerical columns, selected once per engine."""
+        return self.df.select_dtypes(include=[np.number])
+
+    @cached_property
+    def _nums_arr(self) -> np.ndarray:
+        """Numerical columns as a column-major float64 matrix, NaN for missing."""
+        # Column-major so per-column scans (reductions, _iqr_count) walk contiguous memory
+        return np.asfortranarray(self._nums.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    @cached_property
+    def _quartiles(self) -> np.ndarray:
+        """25th, 50th and 75th percentiles of each numerical column as a (3, k) array."""
+        # Shared by get_basic_stats and detect_outliers_iqr, the costliest step of both;
+        # all-NaN columns yield NaN quartiles, as describe() and quantile() do
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanquantile(self._nums_arr, [0.25, 0.5, 0.75], axis=0)
 
     def get_basic_stats(self) -> dict:
         """Returns descriptive statistics."""
-        desc = self.df.describe().to_dict()
-        return desc
+        nums = self._nums
+        if nums.empty:
+            return {}
+        arr = self._nums_arr
+
+        count = np.count_nonzero(~np.isnan(arr), axis=0)
+        # All-NaN and single-value columns yield NaN stats, as describe() does
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(arr, axis=0)
+            std = np.nanstd(arr, axis=0, ddof=1)
+            min_ = np.nanmin(arr, axis=0)
+            max_ = np.nanmax(arr, axis=0)
+        quartiles = self._quartiles
+
+        # Same keys and order as DataFrame.describe()
+        stats = {}
+        for i, col in enumerate(nums.columns):
+            stats[col] = {
+                "count": float(count[i]),
+                "mean": float(mean[i]),
+                "std": float(std[i]),
+                "min": float(min_[i]),
+                "25%": float(quartiles[0, i]),
+                "50%": float(quartiles[1, i]),
+                "75%": float(quartiles[2, i]),
+                "max": float(max_[i])
+            }
+        return stats
 
     def analyze_missing_values(self) -> dict:
         """Returns missing value counts."""
-        missing = self.df.isnull().sum()
-        return missing[missing > 0].to_dict()
+        missing = {}
+        for col in self.df.columns:
+            series = self.df[col]
+            pa_array = getattr(series.array, "_pa_array", None)
+            # Arrow-backed columns track their null count, so no scan is needed;
+            # others are counted one column at a time rather than via a frame-wide mask
+            count = pa_array.null_count if pa_array is not None else int(series.isna().sum())
+            if count > 0:
+                missing[col] = count
+        return missing
 
     def get_categorical_summary(self) -> dict:
         """Returns unique counts for categorical columns."""
-        cat_cols = self.df.select_dtypes(include=['object', 'category']).columns
+        cat_cols = self.df.select_dtypes(include=['object', 'string', 'category']).columns
         summary = {}
         for col in cat_cols:
+            top, unique_count = top_value_counts(self.df[col], 3)
             summary[col] = {
-                "unique_count": self.df[col].nunique(),
-                "top_freq": self.df[col].value_counts().head(3).to_dict()
+                "unique_count": unique_count,
+                "top_freq": {value: int(count) for value, count in top.items()}
             }
         return summary
 
+    @cached_property
+    def corr_matrix(self) -> np.ndarray:
+        """Pearson correlation matrix of the numerical columns, computed once."""
+        nums = self._nums
+        if nums.empty:
+            return np.empty((0, 0))
+        arr = self._nums_arr
+        if np.isnan(arr).any():
+            # Pairwise-complete semantics need per-pair NaN masks
+            return nums.corr().to_numpy(dtype=np.float64)
+
+        # Constant columns yield NaN, as DataFrame.corr() does
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.atleast_2d(np.corrcoef(arr, rowvar=False))
+        diag = np.diag(corr)
+        np.fill_diagonal(corr, np.where(np.isnan(diag), np.nan, 1.0))
+        return corr
+
     def get_correlations(self) -> dict:
         """Computes correlation matrix for numerical columns."""
-        nums = self.df.select_dtypes(include=[np.number])
-        if nums.empty:
-            return {}
-        return nums.corr().to_dict()
+        corr = self.corr_matrix
+        cols = self._nums.columns
+        return {a: {b: float(corr[j, i]) for j, b in enumerate(cols)} for i, a in enumerate(cols)}
 
     def detect_outliers_iqr(self) -> dict:
         """Detects outliers using IQR method for numerical columns."""
-        nums = self.df.select_dtypes(include=[np.number])
-        outliers = {}
-        
-        for col in nums.columns:
-            Q1 = nums[col].quantile(0.25)
-            Q3 = nums[col].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            count = ((nums[col] < lower_bound) | (nums[col] > upper_bound)).sum()
-            if count > 0:
-                outliers[col] = int(count)
-                
-        return outliers
+        nums = self._nums
+        if nums.empty:
+            return {}
+        # All-NaN columns yield NaN bounds (and so no outliers), as pandas does
+        Q1, _, Q3 = self._quartiles
+        IQR = Q3 - Q1
+
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        counts = _iqr_count(self._nums_arr, lower_bound, upper_bound)
+        return {col: int(count) for col, count in zip(nums.columns, counts) if count > 0}
+
+    def summarize(self) -> dict:
+        """Returns all analysis results keyed by report section."""
+        return {
+            "missing_values": self.analyze_missing_values(),
+            "numerical_stats": self.get_basic_stats(),
+            "categorical_summary": self.get_categorical_summary(),
+            "outliers_detected": self.detect_outliers_iqr(),
+            "correlations": self.get_correlations()
+        }
@@ -1,9 +1,16 @@
 import argparse
 import json
 import numpy as np
+from src import cache
 from src.eda_engine import EDAEngine
+from src.streaming import StreamingEDAEngine
 
-# Custom encoder for numpy types
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Custom encoder for numpy types (stdlib json fallback)
 class NpEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, np.integer):
@@ -14,29 +21,70 @@ class NpEncoder(json.JSONEncoder):
             return obj.tolist()
         return super(NpEncoder, self).default(obj)
 
+def _nan_to_none(obj):
+    """Replace non-finite floats with None, as orjson serializes them."""
+    if isinstance(obj, dict):
+        return {key: _nan_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _nan_to_none(obj.tolist())
+    if isinstance(obj, (float, np.floating)) and not np.isfinite(obj):
+        return None
+    return obj
+
+def write_report(report: dict, path: str):
+    """
+    Write report as indented JSON, using orjson when available.
+
+    NaN and infinity are written as null either way, so the report is valid JSON.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(report, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(_nan_to_none(report), f, indent=2, cls=NpEncoder, allow_nan=False)
+
 def main():
     parser = argparse.ArgumentParser(description="Automated EDA Tool")
     parser.add_argument("--file", required=True, help="Path to CSV dataset")
     parser.add_argument("--output", default="eda_report.json", help="Output report file")
+    parser.add_argument("--stream", action="store_true",
+                        help="Process the CSV in blocks for files larger than memory (approximate quartiles; "
+                             "string columns still hold one count per distinct value)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Recompute results even if a cached copy exists for this file")
     
     args = parser.parse_args()
     
     try:
         print(f"Analyzing {args.file}...")
-        engine = EDAEngine(args.file)
+        key = cache.cache_key(args.file, "stream" if args.stream else "")
+        cached = None if args.no_cache else cache.load(key)
+        if cached is not None:
+            print("Using cached results (pass --no-cache to recompute)")
+            shape, summary = cached
+        else:
+            if args.stream:
+                engine = StreamingEDAEngine(args.file)
+                summary = engine.summarize()
+                shape = engine.shape
+            else:
+                engine = EDAEngine(args.file)
+                summary = engine.summarize()
+                shape = engine.df.shape
+            if not cache.save(key, (shape, summary)):
+                print(f"Could not write to the result cache at {cache.CACHE_DIR}; continuing without it")
         
         report = {
             "dataset": args.file,
-            "shape": engine.df.shape,
-            "missing_values": engine.analyze_missing_values(),
-            "numerical_stats": engine.get_basic_stats(),
-            "categorical_summary": engine.get_categorical_summary(),
-            "outliers_detected": engine.detect_outliers_iqr(),
-            "correlations": engine.get_correlations()
+            "shape": shape,
+            **summary
         }
         
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2, cls=NpEncoder)
+        write_report(report, args.output)
             
         print(f"EDA Report saved to {args.output}")
         
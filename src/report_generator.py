@@ -3,8 +3,11 @@ Report Generator Module.
 
 Generates comprehensive HTML reports from EDA results and visualizations.
 """
+import io
 from datetime import datetime
+from html import escape
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
 from .eda_engine import EDAEngine
 from .visualization import Visualizer
@@ -19,7 +22,7 @@ class ReportGenerator:
         self.df = df
         self.title = title
         self.engine = EDAEngine(df)
-        self.viz = Visualizer(df)
+        self.viz = Visualizer(self.engine.df)
         
     def generate_report(self) -> str:
         """
@@ -27,21 +30,24 @@ class ReportGenerator:
         """
         # Gather data
         stats = self.engine.get_basic_stats()
-        missing = self.engine.get_missing_values()
+        missing = self.engine.analyze_missing_values()
         categorical = self.engine.get_categorical_summary()
-        outliers = self.engine.get_outliers()
+        outliers = self.engine.detect_outliers_iqr()
         
-        # Generate Plots
-        hist_fig = self.viz.plot_histograms()
-        corr_fig = self.viz.plot_correlation_heatmap()
-        cat_fig = self.viz.plot_categorical_counts()
+        # Generate Plots, one figure per column so they can be encoded in parallel
+        corr_fig = self.viz.plot_correlation_heatmap(corr_matrix=self.engine.corr_matrix)
+        hist_figs = self.viz.histogram_figures()
+        cat_figs = self.viz.categorical_count_figures()
         
-        hist_img = self.viz.fig_to_base64(hist_fig) if hist_fig else ""
-        corr_img = self.viz.fig_to_base64(corr_fig) if corr_fig else ""
-        cat_img = self.viz.fig_to_base64(cat_fig) if cat_fig else ""
+        corr_figs = [corr_fig] if corr_fig else []
+        images = self.viz.figs_to_base64(corr_figs + hist_figs + cat_figs)
+        corr_img = images[0] if corr_fig else ""
+        hist_imgs = images[len(corr_figs):len(corr_figs) + len(hist_figs)]
+        cat_imgs = images[len(corr_figs) + len(hist_figs):]
         
         # Build HTML
-        html = [
+        html = io.StringIO()
+        html.write(
             f"""<!DOCTYPE html>
             <html>
             <head>
@@ -71,59 +77,84 @@ class ReportGenerator:
                     </div>
                 </div>
             """
-        ]
+        )
         
         # Descriptive Statistics
-        html.append("""
+        html.write("""
             <div class="section">
                 <h2>Descriptive Statistics</h2>
                 <div style="overflow-x: auto;">
         """)
-        html.append(pd.DataFrame(stats).to_html(classes="stats-table", float_format=lambda x: f"{x:.2f}"))
-        html.append("</div></div>")
+        html.write(self._stats_table(stats))
+        html.write("</div></div>")
         
         # Missing Values
         if missing:
-            html.append("""
+            html.write("""
                 <div class="section">
                     <h2>Missing Values Analysis</h2>
                     <table class="stats-table">
                         <thead><tr><th>Column</th><th>Missing Count</th><th>Percentage</th></tr></thead>
                         <tbody>
             """)
-            for col, count in missing.items():
-                pct = (count / len(self.df)) * 100
-                html.append(f"<tr><td>{col}</td><td>{count}</td><td>{pct:.1f}%</td></tr>")
-            html.append("</tbody></table></div>")
+            rows = [f"<tr><td>{col}</td><td>{count}</td><td>{(count / len(self.df)) * 100:.1f}%</td></tr>"
+                    for col, count in missing.items()]
+            html.write("".join(rows))
+            html.write("</tbody></table></div>")
             
         # Outliers
         if outliers:
-            html.append("""
+            html.write("""
                 <div class="section">
                     <h2>Outlier Detection (IQR Method)</h2>
                     <table class="stats-table">
                         <thead><tr><th>Column</th><th>Outlier Count</th></tr></thead>
                         <tbody>
             """)
-            for col, count in outliers.items():
-                html.append(f"<tr><td>{col}</td><td>{count}</td></tr>")
-            html.append("</tbody></table></div>")
+            rows = [f"<tr><td>{col}</td><td>{count}</td></tr>" for col, count in outliers.items()]
+            html.write("".join(rows))
+            html.write("</tbody></table></div>")
             
         # Visualizations
-        html.append('<div class="section"><h2>Visualizations</h2>')
+        html.write('<div class="section"><h2>Visualizations</h2>')
         
         if corr_img:
-            html.append(f'<h3>Correlation Matrix</h3><img src="data:image/png;base64,{corr_img}" alt="Correlation Matrix">')
+            html.write(f'<h3>Correlation Matrix</h3><img src="data:image/png;base64,{corr_img}" alt="Correlation Matrix">')
             
-        if hist_img:
-            html.append(f'<h3>Numerical Distributions</h3><img src="data:image/png;base64,{hist_img}" alt="Histograms">')
+        if hist_imgs:
+            html.write('<h3>Numerical Distributions</h3>')
+            for img in hist_imgs:
+                html.write(f'<img src="data:image/png;base64,{img}" alt="Histogram">')
             
-        if cat_img:
-            html.append(f'<h3>Categorical Distributions</h3><img src="data:image/png;base64,{cat_img}" alt="Categorical Counts">')
+        if cat_imgs:
+            html.write('<h3>Categorical Distributions</h3>')
+            for img in cat_imgs:
+                html.write(f'<img src="data:image/png;base64,{img}" alt="Categorical Counts">')
             
-        html.append("</div></body></html>")
+        html.write("</div></body></html>")
         
-        return "\n".join(html)
+        return html.getvalue()
+
+    @staticmethod
+    def _stats_table(stats: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Render {column: {statistic: value}} as an HTML table, statistics as rows.
+        """
+        if not stats:
+            return ""
+        columns = list(stats)
+        index = list(next(iter(stats.values())))
+        arr = np.array([[stats[col][name] for col in columns] for name in index], dtype=np.float64)
+        # Format every cell in one call rather than per value
+        cells = np.where(np.isnan(arr), "NaN", np.char.mod("%.2f", arr))
+
+        header = "".join(f"<th>{escape(str(col))}</th>" for col in columns)
+        rows = "\n".join(
+            f"<tr><th>{escape(str(name))}</th>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>"
+            for name, row in zip(index, cells)
+        )
+        return (f'<table class="stats-table"><thead><tr><th></th>{header}</tr></thead>'
+                f"<tbody>\n{rows}\n</tbody></table>")
 
     def save_report(self, filepath: str):
         """Save report to file."""
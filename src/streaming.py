@@ -0,0 +1,273 @@
+"""
+Streaming EDA Module.
+
+Computes the EDA report over a CSV one record batch at a time. Numerical columns
+are summarised in memory bounded by the block size; string columns keep an exact
+count per distinct value, so their memory grows with the number of distinct
+values (e.g. with the row count for an ID column).
+"""
+import re
+from collections import Counter
+from functools import cached_property
+from typing import List, Optional, Tuple
+import warnings
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pv
+except ImportError:
+    pa = None
+
+try:
+    from fastdigest import TDigest
+except ImportError:
+    TDigest = None
+
+from .eda_engine import _iqr_count
+
+# Bytes of CSV text parsed per record batch
+BLOCK_SIZE = 64 << 20
+
+# Arrow names the offending column of a CSV conversion error by its position
+CONVERSION_ERROR = re.compile(r"In CSV column #(\d+)")
+
+
+class StreamingEDAEngine:
+    """
+    Out-of-core counterpart of EDAEngine for CSVs larger than memory.
+
+    Two passes are made over the file: the first accumulates null counts,
+    running moments (Chan/Welford), t-digests for quantiles, value counts and
+    pairwise co-moments; the second counts IQR outliers against the
+    digest quartiles. Quartiles, and therefore outlier bounds, are t-digest
+    estimates rather than exact values.
+    """
+
+    def __init__(self, data_path: str, block_size: int = BLOCK_SIZE):
+        if pa is None or TDigest is None:
+            raise ImportError("Streaming mode requires pyarrow and fastdigest (pip install pyarrow fastdigest)")
+        self.data_path = data_path
+        self.block_size = block_size
+        self.shape: Optional[Tuple[int, int]] = None
+
+    @cached_property
+    def _inferred_schema(self):
+        """Schema open_csv infers from the first block of the file."""
+        return pv.open_csv(self.data_path, read_options=pv.ReadOptions(block_size=self.block_size)).schema
+
+    @cached_property
+    def _column_types(self) -> dict:
+        """
+        Column types overriding the first-block inference.
+
+        Integer columns are widened to float64 since later blocks may hold
+        decimals, and columns still empty in the first block are read as
+        float64. Dates and timestamps are kept as text, as EDAEngine keeps
+        them. Columns that later prove not to fit their type are switched to
+        string by summarize().
+        """
+        column_types = {}
+        for field in self._inferred_schema:
+            if pa.types.is_integer(field.type) or pa.types.is_null(field.type):
+                column_types[field.name] = pa.float64()
+            elif pa.types.is_temporal(field.type):
+                column_types[field.name] = pa.string()
+        return column_types
+
+    def _open(self):
+        """Opens a record batch reader over the CSV; only the first block is parsed up front."""
+        return pv.open_csv(
+            self.data_path,
+            read_options=pv.ReadOptions(block_size=self.block_size),
+            convert_options=pv.ConvertOptions(column_types=self._column_types, strings_can_be_null=True)
+        )
+
+    @staticmethod
+    def _split_columns(schema) -> Tuple[List[str], List[str]]:
+        numeric, categorical = [], []
+        for field in schema:
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+                numeric.append(field.name)
+            elif pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+                categorical.append(field.name)
+        return numeric, categorical
+
+    @staticmethod
+    def _numeric_block(batch, columns: List[str]) -> np.ndarray:
+        """Numerical columns of a batch as a column-major (n, k) float64 matrix, NaN for missing."""
+        arr = np.empty((batch.num_rows, len(columns)), dtype=np.float64, order='F')
+        for j, col in enumerate(columns):
+            arr[:, j] = pc.cast(batch.column(col), pa.float64()).to_numpy(zero_copy_only=False)
+        return arr
+
+    def summarize(self) -> dict:
+        """Returns all analysis results keyed by report section, as EDAEngine.summarize does."""
+        while True:
+            try:
+                return self._summarize()
+            except pa.ArrowInvalid as exc:
+                # A later block held a value the column's type cannot represent, e.g. text
+                # in a numeric column: read that column as string and start over
+                self._widen_to_string(exc)
+
+    def _widen_to_string(self, exc: "pa.ArrowInvalid"):
+        match = CONVERSION_ERROR.search(str(exc))
+        if match is None:
+            raise exc
+        name = self._inferred_schema.names[int(match.group(1))]
+        if self._column_types.get(name) == pa.string():
+            raise ValueError(f"Could not read column {name!r} of {self.data_path}: {exc}") from exc
+        self._column_types[name] = pa.string()
+
+    def _summarize(self) -> dict:
+        reader = self._open()
+        numeric, categorical = self._split_columns(reader.schema)
+        n_rows = 0
+        nulls = dict.fromkeys(reader.schema.names, 0)
+        # Exact value counts: unbounded for high-cardinality columns
+        freqs = {col: Counter() for col in categorical}
+        digests = [TDigest() for _ in numeric]
+
+        k = len(numeric)
+        count = np.zeros(k)
+        mean = np.zeros(k)
+        m2 = np.zeros(k)
+        min_ = np.full(k, np.inf)
+        max_ = np.full(k, -np.inf)
+        # Pairwise-complete co-moments over the rows where columns i and j are both present:
+        # pair_n[i, j] counts them, pair_mean[i, j] / pair_m2[i, j] are the mean / squared
+        # deviations of column i over them, pair_c[i, j] the co-moment of columns i and j
+        pair_n = np.zeros((k, k))
+        pair_mean = np.zeros((k, k))
+        pair_m2 = np.zeros((k, k))
+        pair_c = np.zeros((k, k))
+
+        for batch in reader:
+            n_rows += batch.num_rows
+            for name, column in zip(batch.schema.names, batch.columns):
+                nulls[name] += column.null_count
+
+            for col in categorical:
+                counts = pc.value_counts(pc.drop_null(batch.column(col)))
+                freqs[col].update(dict(zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist())))
+
+            if not numeric:
+                continue
+            arr = self._numeric_block(batch, numeric)
+            valid = ~np.isnan(arr)
+            filled = np.where(valid, arr, 0.0)
+
+            # Merge batch moments into the running ones (Chan et al.)
+            b_count = valid.sum(axis=0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                b_mean = np.where(b_count > 0, filled.sum(axis=0) / b_count, 0.0)
+            centred = np.where(valid, arr - b_mean, 0.0)
+            b_m2 = (centred ** 2).sum(axis=0)
+            total = count + b_count
+            with np.errstate(divide='ignore', invalid='ignore'):
+                delta = b_mean - mean
+                mean = np.where(total > 0, mean + delta * b_count / total, 0.0)
+                m2 = m2 + b_m2 + np.where(total > 0, delta ** 2 * count * b_count / total, 0.0)
+            count = total
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                min_ = np.fmin(min_, np.nanmin(arr, axis=0))
+                max_ = np.fmax(max_, np.nanmax(arr, axis=0))
+
+            # Same merge for the pairwise co-moments; values are centred on the batch
+            # means first so large offsets (e.g. timestamps) do not swamp the variance
+            mask = valid.astype(np.float64)
+            b_n = mask.T @ mask
+            b_s = centred.T @ mask
+            with np.errstate(divide='ignore', invalid='ignore'):
+                b_c = np.where(b_n > 0, centred.T @ centred - b_s * b_s.T / b_n, 0.0)
+                b_pm2 = np.where(b_n > 0, (centred ** 2).T @ mask - b_s ** 2 / b_n, 0.0)
+                b_pmean = b_mean[:, None] + np.where(b_n > 0, b_s / b_n, 0.0)
+                pair_total = pair_n + b_n
+                delta = np.where(b_n > 0, b_pmean - pair_mean, 0.0)
+                weight = np.where(pair_total > 0, pair_n * b_n / pair_total, 0.0)
+                pair_c += b_c + delta * delta.T * weight
+                pair_m2 += b_pm2 + delta ** 2 * weight
+                pair_mean += np.where(pair_total > 0, delta * b_n / pair_total, 0.0)
+            pair_n = pair_total
+
+            for j, digest in enumerate(digests):
+                values = arr[:, j]
+                digest.batch_update(values[np.isfinite(values)])
+
+        self.shape = (n_rows, len(nulls))
+        if not numeric:
+            stats, outliers, correlations = {}, {}, {}
+        else:
+            quartiles = np.array([
+                [digest.quantile(q) if digest.n_values else np.nan for q in (0.25, 0.5, 0.75)]
+                for digest in digests
+            ]).T
+            stats = self._stats(numeric, count, mean, m2, min_, max_, quartiles)
+            outliers = self._outliers(numeric, quartiles[0], quartiles[2])
+            correlations = self._correlations(numeric, pair_n, pair_mean, pair_m2, pair_c)
+
+        categorical_summary = {}
+        for col in categorical:
+            categorical_summary[col] = {
+                "unique_count": len(freqs[col]),
+                "top_freq": dict(freqs[col].most_common(3))
+            }
+
+        return {
+            "missing_values": {col: n for col, n in nulls.items() if n},
+            "numerical_stats": stats,
+            "categorical_summary": categorical_summary,
+            "outliers_detected": outliers,
+            "correlations": correlations
+        }
+
+    @staticmethod
+    def _stats(columns, count, mean, m2, min_, max_, quartiles) -> dict:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+        empty = count == 0
+        mean = np.where(empty, np.nan, mean)
+        min_ = np.where(empty, np.nan, min_)
+        max_ = np.where(empty, np.nan, max_)
+
+        # Same keys and order as DataFrame.describe()
+        stats = {}
+        for i, col in enumerate(columns):
+            stats[col] = {
+                "count": float(count[i]),
+                "mean": float(mean[i]),
+                "std": float(std[i]),
+                "min": float(min_[i]),
+                "25%": float(quartiles[0, i]),
+                "50%": float(quartiles[1, i]),
+                "75%": float(quartiles[2, i]),
+                "max": float(max_[i])
+            }
+        return stats
+
+    def _outliers(self, columns, Q1, Q3) -> dict:
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        counts = np.zeros(len(columns), dtype=np.int64)
+        for batch in self._open():
+            counts += _iqr_count(self._numeric_block(batch, columns), lower_bound, upper_bound)
+        return {col: int(count) for col, count in zip(columns, counts) if count > 0}
+
+    @staticmethod
+    def _correlations(columns, n, mean, m2, c) -> dict:
+        # Pearson r over pairwise-complete rows, as DataFrame.corr() computes it
+        # Merging leaves rounding residue where the true variance is zero
+        constant = m2 <= 1e-20 * n * mean ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(c / np.sqrt(m2 * m2.T), -1.0, 1.0)
+        # Constant columns have no correlation, as with DataFrame.corr()
+        corr[constant | constant.T] = np.nan
+        diag = np.diag(corr).copy()
+        np.fill_diagonal(corr, np.where(np.isnan(diag), np.nan, 1.0))
+        return {a: {b: float(corr[j, i]) for j, b in enumerate(columns)} for i, a in enumerate(columns)}
@@ -4,13 +4,25 @@ Visualization Module for Automated EDA.
 Provides functions to generate standard EDA plots using matplotlib and seaborn.
 """
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import seaborn as sns
 import pandas as pd
 import numpy as np
+from scipy.stats import gaussian_kde
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import io
+import os
 import base64
 
+from .eda_engine import top_value_counts
+
+# Row-level plots beyond this many rows are drawn from a random sample
+MAX_PLOT_ROWS = 200_000
+# KDE curves are fitted on at most this many points
+KDE_SAMPLE_SIZE = 5_000
+
 
 class Visualizer:
     """
@@ -26,12 +38,67 @@ class Visualizer:
         plt.style.use('ggplot')
         sns.set_theme(style="whitegrid")
 
-    def plot_histograms(self, columns: Optional[List[str]] = None, figsize=(10, 6)):
+    def _numeric_columns(self) -> List[str]:
+        return self.df.select_dtypes(include=[np.number]).columns.tolist()
+
+    def _categorical_columns(self) -> List[str]:
+        return self.df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+
+    def _plot_data(self) -> pd.DataFrame:
+        if len(self.df) <= MAX_PLOT_ROWS:
+            return self.df
+        return self.df.sample(MAX_PLOT_ROWS, random_state=0)
+
+    @staticmethod
+    def _standalone_figure(figsize):
+        # Built outside pyplot so per-column figures are not tracked by its figure
+        # registry (no "More than 20 figures" warning, nothing left open)
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots()
+
+    def _draw_histogram(self, ax, col: str, kde: bool = False):
+        # Bin with numpy up front so no per-row work happens in the plotting layer
+        series = self.df[col].dropna()
+        values = series.to_numpy(dtype=np.float64)
+        offset = 0.0
+        try:
+            counts, edges = np.histogram(values, bins=50)
+        except ValueError:
+            # Spread too narrow for the magnitude (e.g. 1e15 + noise) to be split into
+            # finite float bins: bin the offsets from the minimum instead
+            offset = values.min()
+            values = values - offset
+            counts, edges = np.histogram(values, bins=50)
+        ax.stairs(counts, edges, fill=True, alpha=0.75)
+
+        if kde:
+            # Fitted on a sample and scaled to match the histogram's counts
+            sample = series.sample(min(KDE_SAMPLE_SIZE, len(series)), random_state=0)
+            sample = sample.to_numpy(dtype=np.float64) - offset
+            if sample.size > 1 and np.ptp(sample) > 0:
+                xs = np.linspace(edges[0], edges[-1], 200)
+                density = gaussian_kde(sample)(xs)
+                ax.plot(xs, density * values.size * (edges[1] - edges[0]))
+
+        ax.set_xlabel(f"{col} - {offset:g}" if offset else col)
+        ax.set_ylabel("Count")
+        ax.set_title(f"Distribution of {col}")
+
+    def _draw_categorical_count(self, ax, col: str):
+        # Limit to top 20 categories to avoid clutter
+        top_cats = top_value_counts(self.df[col], 20)[0].index
+        data = self.df[self.df[col].isin(top_cats)]
+
+        sns.countplot(y=col, data=data, order=top_cats, ax=ax)
+        ax.set_title(f"Count of {col} (Top 20)")
+
+    def plot_histograms(self, columns: Optional[List[str]] = None, figsize=(10, 6), kde: bool = False):
         """
         Plot histograms for numerical columns.
         """
         if columns is None:
-            columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
+            columns = self._numeric_columns()
         
         num_cols = len(columns)
         if num_cols == 0:
@@ -42,17 +109,38 @@ class Visualizer:
             axes = [axes]
             
         for ax, col in zip(axes, columns):
-            sns.histplot(self.df[col], kde=True, ax=ax)
-            ax.set_title(f"Distribution of {col}")
+            self._draw_histogram(ax, col, kde)
             
         plt.tight_layout()
         return fig
 
-    def plot_correlation_heatmap(self, figsize=(10, 8)):
+    def histogram_figures(self, columns: Optional[List[str]] = None, figsize=(10, 6), kde: bool = False) -> list:
+        """
+        Plot one standalone histogram figure per numerical column.
+        """
+        if columns is None:
+            columns = self._numeric_columns()
+
+        figs = []
+        for col in columns:
+            fig, ax = self._standalone_figure(figsize)
+            self._draw_histogram(ax, col, kde)
+            fig.tight_layout()
+            figs.append(fig)
+        return figs
+
+    def plot_correlation_heatmap(self, figsize=(10, 8), corr_matrix: Optional[np.ndarray] = None):
         """
         Plot correlation heatmap for numerical columns.
+
+        A precomputed corr_matrix (ordered like the numerical columns) is used
+        as-is instead of recomputing the correlations.
         """
-        corr = self.df.select_dtypes(include=[np.number]).corr()
+        if corr_matrix is None:
+            corr = self.df.select_dtypes(include=[np.number]).corr()
+        else:
+            columns = self._numeric_columns()
+            corr = pd.DataFrame(corr_matrix, index=columns, columns=columns)
         if corr.empty:
             return None
             
@@ -67,7 +155,7 @@ class Visualizer:
         Plot bar charts for categorical columns.
         """
         if columns is None:
-            columns = self.df.select_dtypes(include=['object', 'category']).columns.tolist()
+            columns = self._categorical_columns()
             
         num_cols = len(columns)
         if num_cols == 0:
@@ -78,28 +166,37 @@ class Visualizer:
             axes = [axes]
             
         for ax, col in zip(axes, columns):
-            # Limit to top 20 categories to avoid clutter
-            top_cats = self.df[col].value_counts().head(20).index
-            data = self.df[self.df[col].isin(top_cats)]
-            
-            sns.countplot(y=col, data=data, order=top_cats, ax=ax)
-            ax.set_title(f"Count of {col} (Top 20)")
+            self._draw_categorical_count(ax, col)
             
         plt.tight_layout()
         return fig
 
+    def categorical_count_figures(self, columns: Optional[List[str]] = None, figsize=(10, 6)) -> list:
+        """
+        Plot one standalone bar chart figure per categorical column.
+        """
+        if columns is None:
+            columns = self._categorical_columns()
+
+        figs = []
+        for col in columns:
+            fig, ax = self._standalone_figure(figsize)
+            self._draw_categorical_count(ax, col)
+            fig.tight_layout()
+            figs.append(fig)
+        return figs
+
     def plot_pairplot(self, columns: Optional[List[str]] = None, hue: Optional[str] = None):
         """
         Generate pairplot for numerical columns.
         """
         if columns is None:
-            columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
+            columns = self._numeric_columns()
             
-        if hue and hue in self.df.columns:
+        data = self._plot_data()
+        if hue and hue in data.columns:
             # Drop rows where hue is NaN for plotting
-            data = self.df.dropna(subset=[hue])
-        else:
-            data = self.df
+            data = data.dropna(subset=[hue])
             
         if len(columns) < 2:
             return None
@@ -111,14 +208,36 @@ class Visualizer:
         fig = sns.pairplot(data[columns + ([hue] if hue else [])], hue=hue)
         return fig
 
+    @staticmethod
+    def _encode_png(fig) -> str:
+        # Figures are already tight_layout()-ed, so skip the extra bbox_inches='tight' render;
+        # zlib level 1 is much cheaper than the default level 6 for a modest size increase
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=96, pil_kwargs={'optimize': False, 'compress_level': 1})
+        return base64.b64encode(buf.getbuffer()).decode('ascii')
+
     @staticmethod
     def fig_to_base64(fig) -> str:
         """
         Convert matplotlib figure to base64 string for HTML embedding.
         """
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight')
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
+        img_str = Visualizer._encode_png(fig)
         plt.close(fig)
         return img_str
+
+    @staticmethod
+    def figs_to_base64(figs: list, max_workers: Optional[int] = None) -> List[str]:
+        """
+        Convert several figures to base64 strings, encoding them in parallel.
+
+        PNG compression releases the GIL, so encodes overlap across threads.
+        Any figures created through pyplot are closed afterwards on the
+        calling thread.
+        """
+        if not figs:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            images = list(pool.map(Visualizer._encode_png, figs))
+        for fig in figs:
+            plt.close(fig)
+        return images
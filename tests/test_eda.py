@@ -1,10 +1,16 @@
 """
 Unit tests for the Automated EDA Tool.
 """
+import json
+import matplotlib.pyplot as plt
 import pytest
 import pandas as pd
 import numpy as np
-from src.eda_engine import EDAEngine
+from src import cache, main
+from src.eda_engine import EDAEngine, top_value_counts
+from src.streaming import StreamingEDAEngine
+from src.report_generator import ReportGenerator
+from src.visualization import Visualizer
 
 
 class TestEDAEngine:
@@ -29,6 +35,19 @@ class TestEDAEngine:
         assert isinstance(engine.df, pd.DataFrame)
         assert len(engine.df) == 5
 
+    def test_initialization_from_dataframe(self, sample_data):
+        """Test engine accepts an already loaded DataFrame."""
+        df = pd.read_csv(sample_data)
+        engine = EDAEngine(df)
+        assert len(engine.df) == 5
+        assert engine.analyze_missing_values() == {'C': 1}
+
+    def test_arrow_backed_dtypes(self, sample_data):
+        """Test CSVs are read into Arrow-backed columns when pyarrow is available."""
+        pytest.importorskip("pyarrow")
+        engine = EDAEngine(sample_data)
+        assert isinstance(engine.df['A'].dtype, pd.ArrowDtype)
+
     def test_basic_stats(self, sample_data):
         """Test descriptive statistics generation."""
         engine = EDAEngine(sample_data)
@@ -62,6 +81,61 @@ class TestEDAEngine:
         # 'x' appears 3 times
         assert summary['B']['top_freq']['x'] == 3
 
+    def test_low_cardinality_strings_become_categorical(self, tmp_path):
+        """Test repetitive string columns are stored as 'category'."""
+        df = pd.DataFrame({
+            'colour': ['red', 'blue'] * 5,
+            'id': [f"id{i}" for i in range(10)]
+        })
+        file_path = tmp_path / "cats.csv"
+        df.to_csv(file_path, index=False)
+
+        engine = EDAEngine(str(file_path))
+        assert isinstance(engine.df['colour'].dtype, pd.CategoricalDtype)
+        assert not isinstance(engine.df['id'].dtype, pd.CategoricalDtype)
+        assert engine.get_categorical_summary()['colour']['top_freq']['red'] == 5
+
+    def test_date_columns_summarised_as_text(self, tmp_path):
+        """Test ISO dates are summarised verbatim, as the C engine reads them."""
+        file_path = tmp_path / "dates.csv"
+        file_path.write_text("day,at\n2024-01-05,2024-01-05T10:00:00\n2024-01-05,2024-01-05T10:00:00\n"
+                             "2024-01-06,2024-01-06T11:30:00\n")
+
+        expected = EDAEngine(str(file_path), engine="c").get_categorical_summary()
+        summary = EDAEngine(str(file_path)).get_categorical_summary()
+        assert summary == expected
+        assert summary['at']['top_freq'] == {'2024-01-05T10:00:00': 2, '2024-01-06T11:30:00': 1}
+
+    def test_top_value_counts(self):
+        """Test top-k ordering, ties, k beyond the distinct values and all-missing input."""
+        top, unique_count = top_value_counts(pd.Series(['b', 'a', 'b', 'a', 'c']), 2)
+        assert list(top.items()) == [('b', 2), ('a', 2)]
+        assert unique_count == 3
+
+        # Ties straddling k go to the values seen first, as with value_counts
+        ids = pd.Series([f"u{i}" for i in range(300)])
+        top, unique_count = top_value_counts(ids, 3)
+        assert list(top.index) == list(ids.value_counts().head(3).index) == ['u0', 'u1', 'u2']
+        assert unique_count == 300
+
+        top, unique_count = top_value_counts(pd.Series(['x', 'y', 'x']), 10)
+        assert list(top.items()) == [('x', 2), ('y', 1)]
+        assert unique_count == 2
+
+        top, unique_count = top_value_counts(pd.Series([None, None], dtype=object), 3)
+        assert top.empty
+        assert unique_count == 0
+
+    def test_all_empty_column(self, tmp_path):
+        """Test a column with no values is reported as an empty numerical column."""
+        file_path = tmp_path / "empty_col.csv"
+        file_path.write_text("A,allnan\n1,\n2,\n3,\n4,\n5,\n")
+
+        engine = EDAEngine(str(file_path))
+        results = engine.summarize()
+        assert results['numerical_stats']['allnan']['count'] == 0
+        assert results['missing_values'] == {'allnan': 5}
+
     def test_correlations(self, sample_data):
         """Test correlation matrix calculation."""
         engine = EDAEngine(sample_data)
@@ -81,5 +155,172 @@ class TestEDAEngine:
         assert outliers['D'] > 0
 
 
+    def test_summarize(self, sample_data):
+        """Test combined summary matches the individual analyses."""
+        engine = EDAEngine(sample_data)
+        summary = engine.summarize()
+
+        assert summary['missing_values'] == engine.analyze_missing_values()
+        assert summary['outliers_detected'] == engine.detect_outliers_iqr()
+        assert set(summary['numerical_stats']) == {'A', 'C', 'D'}
+
+
+class TestStreamingEDAEngine:
+    """Tests for the out-of-core streaming engine."""
+
+    @pytest.fixture
+    def sample_data(self, tmp_path):
+        """Create a CSV spanning several parse blocks."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'A': rng.normal(size=2000),
+            'B': rng.choice(['x', 'y', 'z'], size=2000),
+            'C': np.where(rng.random(2000) < 0.1, np.nan, rng.exponential(size=2000))
+        })
+        file_path = tmp_path / "stream_data.csv"
+        df.to_csv(file_path, index=False)
+        return str(file_path)
+
+    def test_matches_in_memory_engine(self, sample_data):
+        """Test exact sections agree with EDAEngine and quartiles are close."""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("fastdigest")
+        expected = EDAEngine(sample_data).summarize()
+        engine = StreamingEDAEngine(sample_data, block_size=1 << 12)
+        summary = engine.summarize()
+
+        assert engine.shape == (2000, 3)
+        assert summary['missing_values'] == expected['missing_values']
+        assert summary['categorical_summary'] == expected['categorical_summary']
+        for col, stats in expected['numerical_stats'].items():
+            assert summary['numerical_stats'][col]['count'] == stats['count']
+            assert summary['numerical_stats'][col]['mean'] == pytest.approx(stats['mean'])
+            assert summary['numerical_stats'][col]['std'] == pytest.approx(stats['std'])
+            assert summary['numerical_stats'][col]['50%'] == pytest.approx(stats['50%'], abs=0.05)
+        assert summary['correlations']['A']['C'] == pytest.approx(expected['correlations']['A']['C'])
+
+    def test_correlations_with_large_offset(self, tmp_path):
+        """Test correlations stay accurate for columns whose mean dwarfs their spread."""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("fastdigest")
+        rng = np.random.default_rng(0)
+        ts = 1.6e9 + 10 * rng.normal(size=2000)
+        df = pd.DataFrame({'ts': ts, 'y': ts + rng.normal(size=2000)})
+        file_path = tmp_path / "timestamps.csv"
+        df.to_csv(file_path, index=False)
+
+        expected = EDAEngine(str(file_path)).get_correlations()['ts']['y']
+        summary = StreamingEDAEngine(str(file_path), block_size=1 << 12).summarize()
+        assert summary['correlations']['ts']['y'] == pytest.approx(expected, rel=1e-6)
+
+    def test_types_changing_after_first_block(self, tmp_path):
+        """Test columns whose values only widen their type in later blocks."""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("fastdigest")
+        ints = [str(i) for i in range(2000)]
+        ints[-1] = "1.5"
+        late = [""] * 1995 + ["p", "q", "p", "p", "q"]
+        file_path = tmp_path / "widening.csv"
+        file_path.write_text("ints,late\n" + "".join(f"{a},{b}\n" for a, b in zip(ints, late)))
+
+        summary = StreamingEDAEngine(str(file_path), block_size=1 << 12).summarize()
+        assert summary['numerical_stats']['ints']['count'] == 2000
+        assert summary['numerical_stats']['ints']['min'] == 0
+        assert summary['categorical_summary']['late'] == {'unique_count': 2, 'top_freq': {'p': 3, 'q': 2}}
+        assert summary['missing_values'] == {'late': 1995}
+
+    def test_late_values_match_in_memory_engine(self, tmp_path):
+        """Test late numbers, text in numeric columns and dates are typed as in EDAEngine."""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("fastdigest")
+        rows = [f"{i},,{i * 0.5},true,2024-01-0{i % 9 + 1}" for i in range(2500)]
+        rows += [f"{i},{i * 0.5},{i * 0.5},true,2024-01-01" for i in range(500)]
+        rows.append("1,1.0,oops,maybe,2024-01-01")
+        file_path = tmp_path / "late.csv"
+        file_path.write_text("i,x,f,b,day\n" + "\n".join(rows) + "\n")
+
+        expected = EDAEngine(str(file_path)).summarize()
+        summary = StreamingEDAEngine(str(file_path), block_size=1 << 12).summarize()
+        assert set(summary['numerical_stats']) == set(expected['numerical_stats']) == {'i', 'x'}
+        assert summary['numerical_stats']['x']['count'] == 501
+        assert summary['numerical_stats']['x']['mean'] == pytest.approx(expected['numerical_stats']['x']['mean'])
+        assert set(summary['categorical_summary']) == set(expected['categorical_summary']) == {'f', 'b', 'day'}
+        assert summary['categorical_summary']['f']['unique_count'] == expected['categorical_summary']['f']['unique_count']
+        assert summary['categorical_summary']['day'] == expected['categorical_summary']['day']
+
+
+class TestResultCache:
+    """Tests for the on-disk result cache."""
+
+    def test_round_trip_and_invalidation(self, tmp_path):
+        """Test results are reloaded and the key changes with the file."""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("A,B\n1,x\n")
+        key = cache.cache_key(str(file_path))
+
+        assert cache.load(key, tmp_path) is None
+        cache.save(key, {"missing_values": {}}, tmp_path)
+        assert cache.load(key, tmp_path) == {"missing_values": {}}
+
+        assert cache.cache_key(str(file_path), "stream") != key
+        file_path.write_text("A,B\n1,x\n2,y\n")
+        assert cache.cache_key(str(file_path)) != key
+
+    def test_unwritable_cache_dir(self, tmp_path):
+        """Test saving is skipped rather than raising when the cache dir is unusable."""
+        not_a_dir = tmp_path / "afile"
+        not_a_dir.write_text("")
+        assert cache.save("key", {"missing_values": {}}, not_a_dir / "cache") is False
+        assert cache.load("key", not_a_dir / "cache") is None
+
+
+class TestVisualizer:
+    """Tests for the plot builders."""
+
+    def test_histogram_of_narrow_large_values(self):
+        """Test columns too narrow for their magnitude to bin directly are still plotted."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({'big': 1e16 + rng.normal(size=100)})
+        figs = Visualizer(df).histogram_figures(kde=True)
+        assert len(figs) == 1
+        assert figs[0].axes[0].get_xlabel() == "big - 1e+16"
+
+
+class TestReportGenerator:
+    """Tests for the HTML report."""
+
+    def test_generate_report(self):
+        """Test the report embeds one image per plot and formats the statistics."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'A': [1.0, 2.0, 3.0, 4.0, 5.0] * 5,
+            'B': ['x', 'y', 'x', 'z', 'x'] * 5,
+            'C': np.append(rng.normal(size=24), np.nan),
+            'big': 1e16 + rng.normal(size=25)
+        })
+        html = ReportGenerator(df).generate_report()
+
+        # Correlation heatmap, three histograms and one categorical count plot
+        assert html.count('src="data:image/png;base64,') == 5
+        assert "<td>3.00</td>" in html
+        assert "Missing Values Analysis" in html
+        assert plt.get_fignums() == []
+
+
+class TestWriteReport:
+    """Tests for the JSON report writer."""
+
+    def test_nan_written_as_null_with_and_without_orjson(self, tmp_path, monkeypatch):
+        """Test the stdlib fallback writes the same JSON as orjson."""
+        report = {"shape": (2, 1), "numerical_stats": {"A": {"count": np.int64(1), "std": float("nan")}}}
+        expected = {"shape": [2, 1], "numerical_stats": {"A": {"count": 1, "std": None}}}
+
+        main.write_report(report, str(tmp_path / "default.json"))
+        monkeypatch.setattr(main, "orjson", None)
+        main.write_report(report, str(tmp_path / "stdlib.json"))
+
+        assert json.loads((tmp_path / "default.json").read_text()) == expected
+        assert json.loads((tmp_path / "stdlib.json").read_text()) == expected
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])